@@ -215,12 +215,8 @@ def generate_order_detail(order: Dict[str, Any], export_dir: str) -> str:
     def file_section(title: str, files: List[Dict[str, Any]], icon: str) -> str:
         if not files:
             return ""
-        return f"""
-            <div class="file-section">
-                <div class="file-section-title">{icon} {title} ({len(files)})</div>
-                <div class="file-list">
-                    {''.join([
-                        f"""
+        items = ''.join([
+            f"""
                         <div class="file-item">
                             <div class="file-name">{escape_html(f['name'])}</div>
                             <div class="file-meta">
@@ -232,8 +228,13 @@ def generate_order_detail(order: Dict[str, Any], export_dir: str) -> str:
                             </div>
                         </div>
                         """
-                        for f in files
-                    ])}
+            for f in files
+        ])
+        return f"""
+            <div class="file-section">
+                <div class="file-section-title">{icon} {title} ({len(files)})</div>
+                <div class="file-list">
+                    {items}
                 </div>
             </div>
         """
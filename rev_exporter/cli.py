@@ -113,7 +113,9 @@ def sync(
         client = RevAPIClient(config=config)
         order_manager = OrderManager(client)
         attachment_manager = AttachmentManager(client)
-        storage = StorageManager(Path(output_dir))
+        # Batched index writes: the sync loop flushes periodically and
+        # once more after the last order instead of per attachment
+        storage = StorageManager(Path(output_dir), autoflush=False)
 
         if dry_run:
             click.echo("[DRY RUN] No files will be downloaded\n")
@@ -136,12 +138,21 @@ def sync(
         attachments_downloaded = 0
         failures = []
 
-        for i, order in enumerate(completed_orders, 1):
+        # Fetch full order details (with attachments) concurrently up front
+        detailed_orders = order_manager.get_order_details_bulk(
+            [order.order_number for order in completed_orders]
+        )
+
+        for i, (order, full_order) in enumerate(
+            zip(completed_orders, detailed_orders), 1
+        ):
             click.echo(f"Processing order {order.order_number} ({i}/{len(completed_orders)})")
 
             try:
-                # Get full order details with attachments
-                full_order = order_manager.get_order_details(order.order_number)
+                # Surface per-order fetch failures through the same
+                # error accounting as any other processing error
+                if isinstance(full_order, Exception):
+                    raise full_order
                 orders_scanned += 1
 
                 # Save order metadata
@@ -227,6 +238,8 @@ def sync(
                 safe_error = str(error_msg).encode('ascii', 'replace').decode('ascii')
                 click.echo(f"   [ERROR] {safe_error}")
 
+        storage.flush()
+
         # Print summary
         elapsed = datetime.now() - start_time
         click.echo("\n" + "=" * 60)
@@ -289,6 +302,6 @@ def browse(ctx: click.Context, export_dir: Path, no_open: bool) -> None:
         sys.exit(1)
 
 
-if __name__ == "__main__":
+if __name__ == "__main__":  # pragma: no cover
     main()
 
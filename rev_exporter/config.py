@@ -54,7 +54,7 @@ class Config:
         key_file = Path.cwd() / "docs" / "key.md"
         if key_file.exists():
             try:
-                key_content = key_file.read_text(encoding="utf-8").strip()
+                key_content = self._read_key_file(key_file).strip()
                 # Extract the key (first non-empty line)
                 for line in key_content.split("\n"):
                     line = line.strip()
@@ -67,6 +67,10 @@ class Config:
         
         return False
 
+    def _read_key_file(self, key_file: Path) -> str:
+        """Read the raw key file text (narrow seam for tests)."""
+        return key_file.read_text(encoding="utf-8")
+
     def _load_from_env(self) -> bool:
         """Load credentials from environment variables."""
         # Try single API key first (REV_API_KEY)
@@ -94,8 +98,7 @@ class Config:
             return False
 
         try:
-            with open(self.config_file, "r") as f:
-                config_data = json.load(f)
+            config_data = json.loads(self._read_config_file())
 
             # Try single API key first
             api_key = config_data.get("api_key")
@@ -116,6 +119,11 @@ class Config:
 
         return False
 
+    def _read_config_file(self) -> str:
+        """Read the raw config file text (narrow seam for tests)."""
+        with open(self.config_file, "r") as f:
+            return f.read()
+
     def _load_config(self) -> None:
         """Load configuration with priority: ENV vars > config file > key.md."""
         # Try environment variables first
@@ -6,6 +6,7 @@ Ensures API keys are never logged.
 """
 
 import logging
+import re
 import sys
 from typing import Optional
 
@@ -24,17 +25,18 @@ class SensitiveDataFilter(logging.Filter):
         "secret",
     ]
 
+    # One case-insensitive alternation compiled at import time: a single
+    # scan of the message instead of a lowercase copy plus a substring
+    # check per pattern on every log record.
+    _PATTERN_RE = re.compile(
+        "|".join(re.escape(pattern) for pattern in SENSITIVE_PATTERNS),
+        re.IGNORECASE,
+    )
+
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter log records to redact sensitive information."""
-        # Redact sensitive patterns in log messages
-        message = str(record.getMessage())
-        for pattern in self.SENSITIVE_PATTERNS:
-            # Simple redaction - replace any occurrence with [REDACTED]
-            if pattern.lower() in message.lower():
-                # Don't log messages that might contain sensitive data
-                return False
-
-        return True
+        # Don't log messages that might contain sensitive data
+        return self._PATTERN_RE.search(str(record.getMessage())) is None
 
 
 def setup_logging(
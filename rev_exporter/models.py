@@ -4,12 +4,83 @@ Data models for Rev Exporter.
 Defines Order and Attachment data structures.
 """
 
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+import functools
+import operator
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime, timezone
+
+# Slotted dataclasses skip the per-instance __dict__, which adds up
+# when a bulk export materializes thousands of orders and attachments.
+if sys.version_info >= (3, 10):
+    _SLOTS = {"slots": True}
+else:  # pragma: no cover - depends on the interpreter
+    _SLOTS = {}
+
+# Cheap shape guard: strings that don't even start "YYYY-MM-DD" can be
+# rejected without paying for fromisoformat's exception machinery.
+_ISO_GUARD = re.compile(r"^\d{4}-\d{2}-\d{2}($|[T ])")
+_UTC = timezone.utc
+
+
+@functools.lru_cache(maxsize=4096)
+def _fast_iso(s: str) -> Optional[datetime]:
+    """Parse the canonical "YYYY-MM-DDTHH:MM:SS[.fff[fff]]Z" timestamp
+    by slicing digits at fixed offsets, skipping fromisoformat's more
+    general machinery. Returns None on any shape mismatch.
+
+    Cached so orders placed in the same second share one datetime
+    instance instead of re-parsing the identical string.
+    """
+    n = len(s)
+    if (
+        n not in (20, 24, 27)
+        or s[-1] != "Z"
+        or s[4] != "-"
+        or s[7] != "-"
+        or s[10] != "T"
+        or s[13] != ":"
+        or s[16] != ":"
+    ):
+        return None
+    # int() tolerates whitespace, signs, and underscores; require pure
+    # digits so those fall through to None rather than misparse
+    digits = s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
+    if not digits.isdigit():
+        return None
+    microsecond = 0
+    if n != 20:
+        frac = s[20:-1]
+        if s[19] != "." or not frac.isdigit():
+            return None
+        # Three or six fractional digits
+        microsecond = int(frac) * (1000 if n == 24 else 1)
+    try:
+        return datetime(
+            int(s[0:4]),
+            int(s[5:7]),
+            int(s[8:10]),
+            int(s[11:13]),
+            int(s[14:16]),
+            int(s[17:19]),
+            microsecond,
+            tzinfo=_UTC,
+        )
+    except ValueError:
+        # Right shape, out-of-range fields
+        return None
+
+# Common completed status values (may need to verify with actual API)
+_COMPLETED_STATUSES = frozenset({"complete", "completed", "done", "finished"})
 
+# Pulls both required order fields in one call; responses missing
+# either fall back to per-key defaults
+_ORDER_FIELDS = operator.itemgetter("order_number", "status")
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Attachment:
     """Represents an attachment from Rev.com."""
 
@@ -40,7 +111,7 @@ class Attachment:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Order:
     """Represents an order from Rev.com."""
 
@@ -50,6 +121,12 @@ class Order:
     attachments: List[Attachment] = None
     # Additional fields that may be present
     metadata: Optional[Dict[str, Any]] = None
+    # (status, casefolded status) pair filled in lazily by
+    # is_completed(); declared as a field so slotted classes reserve
+    # storage for it
+    _status_cache: Tuple[Any, str] = field(
+        init=False, repr=False, compare=False, default=("", "")
+    )
 
     def __post_init__(self):
         """Initialize default values."""
@@ -67,27 +144,52 @@ class Order:
         Returns:
             Order instance
         """
+        try:
+            order_number, status = _ORDER_FIELDS(data)
+        except KeyError:
+            order_number = data.get("order_number", "")
+            status = data.get("status", "")
+
         # Parse placed_on if present
         placed_on = None
-        if "placed_on" in data:
-            try:
-                # Try parsing ISO format datetime
-                placed_on_str = data["placed_on"]
-                if isinstance(placed_on_str, str):
-                    placed_on = datetime.fromisoformat(placed_on_str.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                pass
+        try:
+            placed_on_str = data["placed_on"]
+        except KeyError:
+            pass
+        else:
+            if isinstance(placed_on_str, str):
+                placed_on = _fast_iso(placed_on_str)
+                if placed_on is None and _ISO_GUARD.match(placed_on_str):
+                    # Single C-level ISO parse; 3.11+ accepts the trailing
+                    # "Z" directly, older versions need the replace fallback.
+                    try:
+                        placed_on = datetime.fromisoformat(placed_on_str)
+                    except ValueError:
+                        try:
+                            placed_on = datetime.fromisoformat(
+                                placed_on_str.replace("Z", "+00:00")
+                            )
+                        except ValueError:
+                            pass
 
         # Parse attachments if present
         attachments = []
-        if "attachments" in data and isinstance(data["attachments"], list):
-            attachments = [
-                Attachment.from_api_response(att) for att in data["attachments"]
-            ]
+        try:
+            raw_attachments = data["attachments"]
+        except KeyError:
+            pass
+        else:
+            if isinstance(raw_attachments, list):
+                attachments = [
+                    Attachment.from_api_response(att) for att in raw_attachments
+                ]
 
         return cls(
-            order_number=data.get("order_number", ""),
-            status=data.get("status", ""),
+            order_number=order_number,
+            # Interned: the handful of distinct status values repeat
+            # across every order in an export. Non-string statuses are
+            # passed through untouched like other malformed fields.
+            status=sys.intern(status) if isinstance(status, str) else status,
             placed_on=placed_on,
             attachments=attachments,
             metadata=data,
@@ -104,7 +206,13 @@ class Order:
         Returns:
             True if order is completed
         """
-        # Common completed status values (may need to verify with actual API)
-        completed_statuses = ["complete", "completed", "done", "finished"]
-        return self.status.lower() in completed_statuses
+        # Cache the folded status keyed on the current value, so bulk
+        # filter passes don't re-lower the same string per call while
+        # post-construction status changes are still picked up
+        status = self.status
+        cached_status, lowered = self._status_cache
+        if status is not cached_status:
+            lowered = status.casefold()
+            self._status_cache = (status, lowered)
+        return lowered in _COMPLETED_STATUSES
 
@@ -3,8 +3,10 @@ Order enumeration and retrieval functionality.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Union
+from datetime import datetime, timezone
 
 from rev_exporter.client import RevAPIClient, RevAPIError
 from rev_exporter.models import Order, Attachment
@@ -15,6 +17,9 @@ logger = logging.getLogger(__name__)
 class OrderManager:
     """Manages order enumeration and retrieval."""
 
+    # How long a cached order-detail response stays valid
+    DETAIL_CACHE_TTL = 300.0
+
     def __init__(self, client: RevAPIClient):
         """
         Initialize OrderManager.
@@ -23,6 +28,7 @@ class OrderManager:
             client: RevAPIClient instance
         """
         self.client = client
+        self._detail_cache: Dict[str, Tuple[float, Order]] = {}
 
     def list_orders(
         self, page: int = 0, results_per_page: int = 50
@@ -57,6 +63,14 @@ class OrderManager:
         """
         Get all orders with pagination.
 
+        Page 0 is fetched first to learn total_count; the remaining page
+        indices are then known up front, so full syncs fetch them
+        concurrently instead of paying one round trip per page.
+        Incremental syncs (``since`` given) walk pages in order so the
+        early stop can skip most requests, but pipeline one page of
+        lookahead so the next response downloads while the current one
+        is parsed.
+
         Args:
             results_per_page: Number of results per page
             since: Optional datetime to filter orders placed after this date
@@ -64,86 +78,174 @@ class OrderManager:
         Returns:
             List of Order objects
         """
-        all_orders = []
-        page = 0
-
         logger.info("Starting order enumeration...")
 
-        while True:
-            try:
-                response = self.list_orders(page=page, results_per_page=results_per_page)
-                orders_data = response.get("orders", [])
+        response = self.list_orders(page=0, results_per_page=results_per_page)
+        first_page = response.get("orders", [])
+        if not first_page:
+            # No orders at all
+            logger.info("Retrieved 0 total orders")
+            return []
 
-                if not orders_data:
-                    # No more orders
-                    break
+        total_count = response.get("total_count", 0)
+        n_pages = -(-total_count // results_per_page) if total_count > 0 else 1
 
-                # Convert to Order objects
-                for order_data in orders_data:
-                    order = Order.from_api_response(order_data)
-
-                    # Apply date filter if specified
-                    if since and order.placed_on:
-                        # Normalize timezones for comparison
-                        since_tz = since
-                        order_tz = order.placed_on
-                        if since_tz.tzinfo is None and order_tz.tzinfo is not None:
-                            # Make since timezone-aware if order is
-                            from datetime import timezone
-                            since_tz = since.replace(tzinfo=timezone.utc)
-                        elif since_tz.tzinfo is not None and order_tz.tzinfo is None:
-                            # Make order timezone-aware if since is
-                            from datetime import timezone
-                            order_tz = order.placed_on.replace(tzinfo=timezone.utc)
-                        
-                        if order_tz < since_tz:
-                            # Orders are typically returned newest first,
-                            # so if we hit an order older than 'since', we can stop
-                            logger.info(
-                                f"Reached order older than filter date, stopping pagination"
-                            )
-                            return all_orders
-
-                    all_orders.append(order)
-
-                logger.debug(
-                    f"Retrieved page {page}: {len(orders_data)} orders "
-                    f"(total so far: {len(all_orders)})"
-                )
+        all_orders: List[Order] = []
+
+        def consume(orders_data: List[Dict[str, Any]]) -> bool:
+            """Convert one page of order dicts; return False to stop paging."""
+            for order_data in orders_data:
+                order = Order.from_api_response(order_data)
+
+                # Apply date filter if specified
+                if since and order.placed_on:
+                    # Normalize timezones for comparison
+                    since_tz = since
+                    order_tz = order.placed_on
+                    if since_tz.tzinfo is None and order_tz.tzinfo is not None:
+                        # Make since timezone-aware if order is
+                        since_tz = since.replace(tzinfo=timezone.utc)
+                    elif since_tz.tzinfo is not None and order_tz.tzinfo is None:
+                        # Make order timezone-aware if since is
+                        order_tz = order.placed_on.replace(tzinfo=timezone.utc)
+
+                    if order_tz < since_tz:
+                        # Orders are typically returned newest first,
+                        # so if we hit an order older than 'since', we can stop
+                        logger.info(
+                            "Reached order older than filter date, stopping pagination"
+                        )
+                        return False
 
-                # Check if we've retrieved all orders
-                total_count = response.get("total_count", 0)
+                all_orders.append(order)
+            return True
+
+        def consume_pages(responses) -> None:
+            """Drain page responses in order until done or told to stop."""
+            for page_response in responses:
+                orders_data = page_response.get("orders", [])
+                if not orders_data or not consume(orders_data):
+                    break
                 if len(all_orders) >= total_count:
                     break
 
-                page += 1
+        if not consume(first_page):
+            return all_orders
+
+        if since is not None:
+            if n_pages > 1:
+
+                def pipelined_pages():
+                    """Yield pages in order, downloading page k+1 while k parses.
 
-            except RevAPIError as e:
-                logger.error(f"Error during pagination at page {page}: {e}")
-                raise
+                    Costs at most one page of overfetch when the since
+                    filter stops mid-pagination.
+                    """
+                    with ThreadPoolExecutor(max_workers=1) as executor:
+                        future = executor.submit(
+                            self.list_orders, page=1, results_per_page=results_per_page
+                        )
+                        for page in range(1, n_pages):
+                            page_response = future.result()
+                            if page + 1 < n_pages:
+                                future = executor.submit(
+                                    self.list_orders,
+                                    page=page + 1,
+                                    results_per_page=results_per_page,
+                                )
+                            yield page_response
+
+                consume_pages(pipelined_pages())
+        elif n_pages > 1:
+            with ThreadPoolExecutor(max_workers=min(8, n_pages - 1)) as executor:
+                consume_pages(
+                    executor.map(
+                        lambda page: self.list_orders(
+                            page=page, results_per_page=results_per_page
+                        ),
+                        range(1, n_pages),
+                    )
+                )
 
         logger.info(f"Retrieved {len(all_orders)} total orders")
         return all_orders
 
-    def get_order_details(self, order_number: str) -> Order:
+    def get_order_details(self, order_number: str, refresh: bool = False) -> Order:
         """
         Get detailed information for a specific order.
 
+        Responses are cached in memory for DETAIL_CACHE_TTL seconds, so
+        repeat lookups within one run don't re-issue the GET.
+
         Args:
             order_number: Order number
+            refresh: Bypass the cache and re-fetch from the API
 
         Returns:
             Order object with full details including attachments
         """
+        if not refresh:
+            cached = self._detail_cache.get(order_number)
+            if cached is not None and time.monotonic() - cached[0] < self.DETAIL_CACHE_TTL:
+                logger.debug(f"Using cached details for order {order_number}")
+                return cached[1]
+
         try:
             response = self.client.get(f"/orders/{order_number}")
             order = Order.from_api_response(response)
+            self._detail_cache[order_number] = (time.monotonic(), order)
             logger.debug(f"Retrieved details for order {order_number}")
             return order
         except RevAPIError as e:
             logger.error(f"Failed to get order details for {order_number}: {e}")
             raise
 
+    def invalidate(self, order_number: Optional[str] = None) -> None:
+        """
+        Drop cached order details.
+
+        Args:
+            order_number: Specific order to evict; evicts everything
+                when omitted
+        """
+        if order_number is None:
+            self._detail_cache.clear()
+        else:
+            self._detail_cache.pop(order_number, None)
+
+    def get_order_details_bulk(
+        self, order_numbers: List[str], max_workers: int = 16
+    ) -> List[Union[Order, Exception]]:
+        """
+        Get detailed information for many orders concurrently.
+
+        The API has no bulk endpoint, so this fans the per-order GETs out
+        over a bounded thread pool instead of paying one round trip per
+        order.
+
+        Args:
+            order_numbers: Order numbers to fetch
+            max_workers: Upper bound on concurrent requests
+
+        Returns:
+            List aligned with order_numbers where each entry is either the
+            Order or the exception raised while fetching it, so one bad
+            order doesn't abort the whole batch.
+        """
+        if not order_numbers:
+            return []
+
+        def fetch(order_number: str) -> Union[Order, Exception]:
+            try:
+                return self.get_order_details(order_number)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(order_numbers))
+        ) as executor:
+            return list(executor.map(fetch, order_numbers))
+
     def filter_completed_orders(self, orders: List[Order]) -> List[Order]:
         """
         Filter orders to only include completed ones.
@@ -2,10 +2,20 @@
 File storage and idempotency management.
 """
 
+import hashlib
 import json
 import logging
+import os
+import shutil
 from pathlib import Path
-from typing import Set, Dict, Any, Optional
+
+try:
+    # Optional: C-accelerated JSON for the index/metadata hot path
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Set, Dict, Any, Optional, Union
 from datetime import datetime
 
 from rev_exporter.models import Order, Attachment
@@ -14,35 +24,138 @@ from rev_exporter.attachments import AttachmentType, AttachmentManager
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize to indented JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Dict[str, Any]:
+    """Parse JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over attachment ids (4 hash probes).
+
+    A miss is definitive; a hit may be a false positive and must be
+    confirmed against the authoritative set.
+    """
+
+    def __init__(self, size_bits: int = 1 << 20):
+        self._size = size_bits
+        self._bits = bytearray(size_bits // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        for i in range(0, 16, 4):
+            yield int.from_bytes(digest[i : i + 4], "big") % self._size
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
 class StorageManager:
     """Manages file storage and idempotency."""
 
-    def __init__(self, output_dir: Path, index_file: Optional[Path] = None):
+    # In batched mode, flush the index every N marked downloads
+    FLUSH_EVERY = 256
+
+    # Worker threads for async attachment writes
+    WRITE_WORKERS = 4
+
+    # Which per-order subdirectory each attachment type lands in;
+    # captions live alongside transcripts
+    _SUBDIRS = {
+        AttachmentType.MEDIA: "media",
+        AttachmentType.TRANSCRIPT: "transcripts",
+        AttachmentType.CAPTION: "transcripts",
+        AttachmentType.OTHER: "other",
+    }
+
+    def __init__(
+        self,
+        output_dir: Path,
+        index_file: Optional[Path] = None,
+        autoflush: bool = True,
+        async_writes: bool = False,
+        use_bloom: bool = False,
+    ):
         """
         Initialize StorageManager.
 
         Args:
             output_dir: Root directory for exports
             index_file: Path to index file for tracking downloads
+            autoflush: Write the index on every mark_downloaded call.
+                When False, writes are coalesced and flushed every
+                FLUSH_EVERY marks, on flush(), or on context-manager
+                exit — one serialization pass instead of one per file.
+            async_writes: Hand attachment writes to a small thread pool
+                so disk latency overlaps the next download. When True,
+                save_attachment returns a Future[Path]; flush() and
+                context-manager exit wait for pending writes.
+            use_bloom: Put a Bloom filter in front of is_downloaded so
+                the common not-downloaded case is answered from a
+                compact bit array; hits are confirmed against the set.
         """
         self.output_dir = Path(output_dir)
         self.index_file = index_file or self.output_dir / ".rev-exporter-index.json"
+        # Append-only sidecar: one attachment id per line, folded back
+        # into the JSON snapshot on flush()/compact()
+        self.log_file = self.index_file.with_suffix(".log")
+        self.autoflush = autoflush
         self.downloaded_attachments: Set[str] = set()
+        self._dirty = False
+        self._order_dirs_cache: Dict[str, Dict[str, Path]] = {}
+        self._pool = ThreadPoolExecutor(max_workers=self.WRITE_WORKERS) if async_writes else None
+        self._pending_writes: List["Future[Path]"] = []
+        self._bloom = _BloomFilter() if use_bloom else None
         self._load_index()
+        if self._bloom is not None:
+            for attachment_id in self.downloaded_attachments:
+                self._bloom.add(attachment_id)
+
+    def __enter__(self) -> "StorageManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
 
     def _load_index(self) -> None:
         """Load the download index from file."""
         if self.index_file.exists():
             try:
-                with open(self.index_file, "r") as f:
-                    data = json.load(f)
-                    self.downloaded_attachments = set(data.get("downloaded_attachments", []))
+                with open(self.index_file, "rb") as f:
+                    data = _json_loads(f.read())
+                self.downloaded_attachments = {*data.get("downloaded_attachments", ())}
                 logger.debug(
                     f"Loaded index with {len(self.downloaded_attachments)} downloaded attachments"
                 )
-            except (json.JSONDecodeError, IOError) as e:
+            except (ValueError, IOError) as e:
                 logger.warning(f"Failed to load index file: {e}")
 
+        if self.log_file.exists():
+            # Marks left behind by an interrupted batched run; fold them
+            # into the snapshot on the next flush
+            try:
+                self.downloaded_attachments.update(
+                    line for line in self.log_file.read_text().splitlines() if line
+                )
+                self._dirty = True
+                logger.debug(f"Recovered append log {self.log_file}")
+            except IOError as e:
+                logger.warning(f"Failed to load index log: {e}")
+
     def _save_index(self) -> None:
         """Save the download index to file."""
         try:
@@ -50,8 +163,8 @@ class StorageManager:
                 "downloaded_attachments": list(self.downloaded_attachments),
                 "last_updated": datetime.utcnow().isoformat(),
             }
-            with open(self.index_file, "w") as f:
-                json.dump(data, f, indent=2)
+            with open(self.index_file, "wb") as f:
+                f.write(_json_dumps(data))
         except IOError as e:
             logger.error(f"Failed to save index file: {e}")
 
@@ -65,6 +178,9 @@ class StorageManager:
         Returns:
             True if already downloaded
         """
+        if self._bloom is not None and attachment_id not in self._bloom:
+            # Bloom misses are definitive
+            return False
         return attachment_id in self.downloaded_attachments
 
     def mark_downloaded(self, attachment_id: str) -> None:
@@ -75,7 +191,37 @@ class StorageManager:
             attachment_id: Attachment ID
         """
         self.downloaded_attachments.add(attachment_id)
+        if self._bloom is not None:
+            self._bloom.add(attachment_id)
+        self._dirty = True
+        if self.autoflush:
+            self.flush()
+            return
+
+        # Batched mode: an O(1) append keeps the mark durable without
+        # rewriting the whole JSON snapshot
+        try:
+            with open(self.log_file, "a") as f:
+                f.write(f"{attachment_id}\n")
+        except IOError as e:
+            logger.error(f"Failed to append to index log: {e}")
+
+        if len(self.downloaded_attachments) % self.FLUSH_EVERY == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Wait for pending writes and persist the index if dirty."""
+        for future in self._pending_writes:
+            future.result()
+        self._pending_writes.clear()
+        if self._dirty:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the JSON snapshot from memory and drop the append log."""
         self._save_index()
+        self.log_file.unlink(missing_ok=True)
+        self._dirty = False
 
     def get_order_dir(self, order_number: str) -> Path:
         """
@@ -99,6 +245,12 @@ class StorageManager:
         Returns:
             Dictionary with paths: media, transcripts, other
         """
+        # Memoized: every attachment in an order reuses the same four
+        # directories, so only the first call pays for the mkdirs
+        cached = self._order_dirs_cache.get(order_number)
+        if cached is not None:
+            return cached
+
         order_dir = self.get_order_dir(order_number)
         order_dir.mkdir(parents=True, exist_ok=True)
 
@@ -110,12 +262,14 @@ class StorageManager:
         transcripts_dir.mkdir(exist_ok=True)
         other_dir.mkdir(exist_ok=True)
 
-        return {
+        dirs = {
             "root": order_dir,
             "media": media_dir,
             "transcripts": transcripts_dir,
             "other": other_dir,
         }
+        self._order_dirs_cache[order_number] = dirs
+        return dirs
 
     def save_attachment(
         self,
@@ -124,7 +278,7 @@ class StorageManager:
         attachment_type: AttachmentType,
         content: bytes,
         file_extension: str,
-    ) -> Path:
+    ) -> Union[Path, "Future[Path]"]:
         """
         Save an attachment to disk.
 
@@ -136,36 +290,98 @@ class StorageManager:
             file_extension: File extension (with leading dot)
 
         Returns:
-            Path to saved file
+            Path to saved file, or a Future resolving to it when
+            async_writes is enabled
         """
-        # Create directory structure
-        dirs = self.create_order_structure(order_number)
+        if self._pool is not None:
+            future = self._pool.submit(
+                self._save_attachment_sync,
+                order_number,
+                attachment,
+                attachment_type,
+                content,
+                file_extension,
+            )
+            self._pending_writes.append(future)
+            return future
+        return self._save_attachment_sync(
+            order_number, attachment, attachment_type, content, file_extension
+        )
+
+    def _save_attachment_sync(
+        self,
+        order_number: str,
+        attachment: Attachment,
+        attachment_type: AttachmentType,
+        content: bytes,
+        file_extension: str,
+    ) -> Path:
+        """Write an attachment to disk on the calling thread."""
+        file_path = self._target_path(order_number, attachment, attachment_type, file_extension)
 
-        # Determine target directory
-        if attachment_type == AttachmentType.MEDIA:
-            target_dir = dirs["media"]
-        elif attachment_type == AttachmentType.TRANSCRIPT:
-            target_dir = dirs["transcripts"]
-        elif attachment_type == AttachmentType.CAPTION:
-            target_dir = dirs["transcripts"]  # Captions go with transcripts
-        else:
-            target_dir = dirs["other"]
+        # One-shot write on a raw fd: skips buffered-writer setup, which
+        # adds up across many small attachments
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(content)
+            while view:
+                view = view[os.write(fd, view):]
+            if hasattr(os, "posix_fadvise"):
+                # Downloaded blobs are write-once; don't let them evict
+                # hotter pages from the cache
+                os.posix_fadvise(fd, 0, len(content), os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
 
-        # Generate filename: <attachment_id>_<sanitized_name>.<ext>
-        from rev_exporter.attachments import AttachmentManager
+        logger.debug(f"Saved attachment {attachment.id} to {file_path}")
+        return file_path
 
-        sanitized_name = AttachmentManager.sanitize_filename(attachment.name or "attachment")
-        filename = f"{attachment.id}_{sanitized_name}{file_extension}"
+    def save_attachment_stream(
+        self,
+        order_number: str,
+        attachment: Attachment,
+        attachment_type: AttachmentType,
+        src,
+        file_extension: str,
+    ) -> Path:
+        """
+        Stream an attachment to disk without buffering it in memory.
 
-        file_path = target_dir / filename
+        Args:
+            order_number: Order number
+            attachment: Attachment object
+            attachment_type: Classified attachment type
+            src: File-like object yielding the attachment bytes
+            file_extension: File extension (with leading dot)
+
+        Returns:
+            Path to saved file
+        """
+        file_path = self._target_path(order_number, attachment, attachment_type, file_extension)
 
-        # Write file
-        with open(file_path, "wb") as f:
-            f.write(content)
+        # 1 MiB copy window keeps peak memory flat regardless of blob size
+        with open(file_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
 
         logger.debug(f"Saved attachment {attachment.id} to {file_path}")
         return file_path
 
+    def _target_path(
+        self,
+        order_number: str,
+        attachment: Attachment,
+        attachment_type: AttachmentType,
+        file_extension: str,
+    ) -> Path:
+        """Resolve the destination path for an attachment, creating dirs."""
+        dirs = self.create_order_structure(order_number)
+        target_dir = dirs[self._SUBDIRS.get(attachment_type, "other")]
+
+        # Generate filename: <attachment_id>_<sanitized_name>.<ext>
+        sanitized_name = AttachmentManager.sanitize_filename(attachment.name or "attachment")
+        filename = f"{attachment.id}_{sanitized_name}{file_extension}"
+        return target_dir / filename
+
     def save_order_metadata(self, order: Order) -> Path:
         """
         Save order metadata as JSON.
@@ -197,8 +413,8 @@ class StorageManager:
             ],
         }
 
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f, indent=2)
+        with open(metadata_file, "wb") as f:
+            f.write(_json_dumps(metadata))
 
         logger.debug(f"Saved order metadata to {metadata_file}")
         return metadata_file
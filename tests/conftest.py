@@ -2,6 +2,7 @@
 Pytest configuration and fixtures.
 """
 
+import copy
 import os
 import json
 import pytest
@@ -9,24 +10,129 @@ from pathlib import Path
 from unittest.mock import Mock, MagicMock
 from typing import Dict, Any
 
+from requests import Response
+
 from rev_exporter.config import Config
-from rev_exporter.client import RevAPIClient
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Shared Click CLI runner (stateless, so safe to reuse all session)."""
+    from click.testing import CliRunner
+
+    return CliRunner()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _api_keys():
+    """Provide API-key env vars once for the whole session.
+
+    Real credentials (needed by the integration/e2e suites) are left
+    untouched; tests that require an unconfigured environment delenv
+    per-test, which shadows this fixture.
+    """
+    mp = pytest.MonkeyPatch()
+    if not os.getenv("REV_CLIENT_API_KEY"):
+        mp.setenv("REV_CLIENT_API_KEY", "test_client")
+    if not os.getenv("REV_USER_API_KEY"):
+        mp.setenv("REV_USER_API_KEY", "test_user")
+    yield
+    mp.undo()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Import the heavy modules once up front on each worker.
+
+    Pulls in the rev_exporter modules (and transitively urllib3) before
+    the first test runs, so cold-import cost doesn't land in — and skew
+    the timing of — whichever test happens to go first.
+    """
+    import requests  # noqa: F401
+    from rev_exporter import client, logging_config, orders, attachments, storage  # noqa: F401
+
+    requests.Session().close()  # warm the adapter registry
+
+
+@pytest.fixture(autouse=True)
+def _isolated_home(tmp_path, monkeypatch):
+    """Point Path.cwd and Path.home at an empty directory for every test.
+
+    Config hunts for config.json and docs/key.md in both locations, so
+    isolating them centrally keeps a developer's real config files out of
+    the suite and replaces the cwd/home patches that were copy-pasted
+    across individual tests.
+    """
+    monkeypatch.setattr("pathlib.Path.cwd", lambda: tmp_path)
+    monkeypatch.setattr("rev_exporter.config.Path.home", lambda: tmp_path)
+    yield tmp_path
+
+
+@pytest.fixture
+def not_configured_env(monkeypatch):
+    """Clear API-key env vars (cwd/home isolation is autouse)."""
+    for key in ("REV_CLIENT_API_KEY", "REV_USER_API_KEY", "REV_API_KEY"):
+        monkeypatch.delenv(key, raising=False)
+
+
+@pytest.fixture(scope="module")
+def _base_mocks():
+    """Build autospec'd manager mocks once per module (the class walk is slow).
+
+    Unlike a bare Mock, autospec rejects attributes and call signatures
+    the real managers don't have, so API drift fails in the unit tests.
+    """
+    from unittest.mock import create_autospec
+    from rev_exporter.orders import OrderManager
+    from rev_exporter.attachments import AttachmentManager
+    from rev_exporter.storage import StorageManager
+
+    return {
+        "order": create_autospec(OrderManager, instance=True),
+        "att": create_autospec(AttachmentManager, instance=True),
+        "storage": create_autospec(StorageManager, instance=True),
+    }
+
+
+@pytest.fixture
+def mocks(_base_mocks):
+    """Per-test view of the shared manager mocks.
+
+    Recursively resetting calls, return values, and side effects is much
+    cheaper than rebuilding the spec'd attribute graph for every test.
+    """
+    for mock in _base_mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    return _base_mocks
 
 
 @pytest.fixture
-def mock_config():
+def patched_managers(mocker, mocks):
+    """Patch the CLI's manager classes to return the shared mocks."""
+    mocker.patch("rev_exporter.cli.OrderManager", return_value=mocks["order"])
+    mocker.patch("rev_exporter.cli.AttachmentManager", return_value=mocks["att"])
+    mocker.patch("rev_exporter.cli.StorageManager", return_value=mocks["storage"])
+    return mocks
+
+
+@pytest.fixture(scope="session")
+def _base_config():
+    """Construct Config once per session; __init__ walks cwd/home for files."""
+    return Config()
+
+
+@pytest.fixture
+def mock_config(_base_config):
     """Create a mock config with API keys."""
-    config = Config()
+    config = copy.copy(_base_config)
     config.client_api_key = "test_client_key"
     config.user_api_key = "test_user_key"
     return config
 
 
 @pytest.fixture
-def mock_config_unconfigured(monkeypatch, tmp_path):
+def mock_config_unconfigured():
     """Create a mock config without API keys."""
-    # Mock Path.cwd to prevent loading from docs/key.md
-    monkeypatch.setattr("pathlib.Path.cwd", lambda: tmp_path)
     config = Config()
     config.api_key = None
     config.client_api_key = None
@@ -34,6 +140,22 @@ def mock_config_unconfigured(monkeypatch, tmp_path):
     return config
 
 
+@pytest.fixture
+def sample_order():
+    """A completed order with no attachments."""
+    from rev_exporter.models import Order
+
+    return Order(order_number="12345", status="Complete")
+
+
+@pytest.fixture
+def transcript_attachment():
+    """A typical transcript attachment."""
+    from rev_exporter.models import Attachment
+
+    return Attachment(id="att_001", name="transcript.txt", type="transcript")
+
+
 @pytest.fixture
 def sample_order_data():
     """Sample order data from API."""
@@ -91,6 +213,16 @@ def sample_attachment_data():
     }
 
 
+@pytest.fixture(scope="module")
+def mock_output_dir(tmp_path_factory):
+    """Shared output directory for tests whose StorageManager is mocked.
+
+    Nothing real is written, so one directory per module is enough and
+    saves a mkdir/rmdir cycle per test.
+    """
+    return tmp_path_factory.mktemp("exports")
+
+
 @pytest.fixture
 def temp_output_dir(tmp_path):
     """Create a temporary output directory."""
@@ -99,29 +231,51 @@ def temp_output_dir(tmp_path):
     return output_dir
 
 
-@pytest.fixture
-def mock_api_client(mock_config):
-    """Create a mock API client."""
-    client = RevAPIClient(config=mock_config)
-    return client
+@pytest.fixture(scope="module")
+def mock_api_client(_base_config):
+    """Create a mock API client, shared per module.
+
+    Session construction (adapter mounts, default headers, retry config)
+    is the expensive part of RevAPIClient; tests only patch client.get
+    inside with-blocks, which restore themselves, so reuse is safe.
+    """
+    # Imported lazily so the hot-reload daemon doesn't pin a stale
+    # module reference across code edits.
+    from rev_exporter.client import RevAPIClient
+
+    config = copy.copy(_base_config)
+    config.client_api_key = "test_client_key"
+    config.user_api_key = "test_user_key"
+    return RevAPIClient(config=config)
+
+
+class _CannedResponse(Response):
+    """Real Response with pre-set JSON; no Mock attribute machinery.
+
+    Building this is a handful of plain attribute assignments, and
+    status_code/content/text/raise_for_status all behave like the real
+    thing instead of being inert Mock children.
+    """
+
+    def json(self, **kwargs):
+        return self._json
 
 
 @pytest.fixture
 def mock_requests_response():
-    """Create a mock requests Response object."""
+    """Create a canned requests Response object."""
     def _create_response(
         status_code=200,
         json_data=None,
         content=None,
         headers=None,
     ):
-        response = Mock()
+        response = _CannedResponse()
         response.status_code = status_code
-        response.headers = headers or {}
-        response.json.return_value = json_data or {}
-        response.content = content or b""
-        response.text = content.decode("utf-8") if content else ""
-        response.raise_for_status = Mock()
+        response._content = content or b""
+        response._json = json_data or {}
+        if headers:
+            response.headers.update(headers)
         return response
 
     return _create_response
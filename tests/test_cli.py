@@ -2,564 +2,310 @@
 Unit tests for CLI module.
 """
 
+import re
+
 import pytest
-import sys
-from unittest.mock import Mock, patch, MagicMock
-from click.testing import CliRunner
 
 from rev_exporter.cli import main
 from rev_exporter.config import Config
 from rev_exporter.attachments import AttachmentType
+from rev_exporter.models import Attachment
+
+# Compiled once: failure reporting may print kilobytes of output, so a
+# single scan beats repeated substring checks.
+_FAILED_RE = re.compile(r"Failed|failures", re.IGNORECASE)
+
+
+@pytest.fixture(scope="module")
+def sync_argv(mock_output_dir):
+    """Base argv for sync invocations against the shared output dir."""
+    return ["sync", "--output-dir", str(mock_output_dir)]
+
+
+@pytest.fixture(scope="module")
+def many_failing_attachments():
+    """15 attachments whose downloads will be made to fail (built once)."""
+    return [
+        Attachment(id=f"att_{i:03d}", name=f"file_{i}.txt", type="transcript")
+        for i in range(15)
+    ]
 
 
 class TestCLI:
     """Test CLI commands."""
 
-    def test_main_group(self):
+    def test_main_group(self, runner):
         """Test main CLI group."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["--help"])
+        result = runner.invoke(main, ["--help"], catch_exceptions=False)
         assert result.exit_code == 0
         assert "Rev Exporter" in result.output
 
-    def test_test_connection_success(self, monkeypatch):
+    def test_test_connection_success(self, mocker, runner):
         """Test test-connection command success."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
+        mock_client = mocker.patch("rev_exporter.cli.RevAPIClient").return_value
+        mock_client.test_connection.return_value = True
 
-        runner = CliRunner()
-
-        with patch("rev_exporter.cli.RevAPIClient") as mock_client_class:
-            mock_client = Mock()
-            mock_client.test_connection.return_value = True
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(main, ["test-connection"])
-            assert result.exit_code == 0
-            assert "successful" in result.output.lower()
+        result = runner.invoke(main, ["test-connection"], catch_exceptions=False)
+        assert result.exit_code == 0
+        out = result.output.lower()
+        assert "successful" in out
 
-    def test_test_connection_failure(self, monkeypatch):
+    def test_test_connection_failure(self, mocker, runner):
         """Test test-connection command failure."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
+        mock_client = mocker.patch("rev_exporter.cli.RevAPIClient").return_value
+        mock_client.test_connection.return_value = False
 
-        runner = CliRunner()
-
-        with patch("rev_exporter.cli.RevAPIClient") as mock_client_class:
-            mock_client = Mock()
-            mock_client.test_connection.return_value = False
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(main, ["test-connection"])
-            assert result.exit_code == 1
-            assert "failed" in result.output.lower()
+        result = runner.invoke(main, ["test-connection"], catch_exceptions=False)
+        assert result.exit_code == 1
+        out = result.output.lower()
+        assert "failed" in out
 
-    def test_test_connection_unconfigured(self, monkeypatch, tmp_path):
+    def test_test_connection_unconfigured(self, runner, not_configured_env):
         """Test test-connection when not configured."""
-        # Clear environment
-        monkeypatch.delenv("REV_CLIENT_API_KEY", raising=False)
-        monkeypatch.delenv("REV_USER_API_KEY", raising=False)
-        monkeypatch.delenv("REV_API_KEY", raising=False)
-        # Mock Path.cwd to prevent loading from docs/key.md
-        monkeypatch.setattr("pathlib.Path.cwd", lambda: tmp_path)
-
-        runner = CliRunner()
-        result = runner.invoke(main, ["test-connection"])
+        result = runner.invoke(main, ["test-connection"], catch_exceptions=False)
         assert result.exit_code == 1
-        assert "not configured" in result.output.lower()
+        out = result.output.lower()
+        assert "not configured" in out
 
-    def test_sync_basic(self, monkeypatch, tmp_path):
+    def test_sync_basic(self, runner, sync_argv, patched_managers):
         """Test sync command basic functionality."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
+        # Setup mocks
+        mock_order_mgr = patched_managers["order"]
+        mock_order_mgr.get_all_orders.return_value = []
+        mock_order_mgr.filter_completed_orders.return_value = []
 
-        runner = CliRunner()
+        result = runner.invoke(main, sync_argv, catch_exceptions=False)
 
-        with patch("rev_exporter.cli.OrderManager") as mock_order_mgr_class, \
-             patch("rev_exporter.cli.AttachmentManager") as mock_att_mgr_class, \
-             patch("rev_exporter.cli.StorageManager") as mock_storage_class:
-
-            # Setup mocks
-            mock_order_mgr = Mock()
-            mock_order_mgr.get_all_orders.return_value = []
-            mock_order_mgr.filter_completed_orders.return_value = []
-            mock_order_mgr_class.return_value = mock_order_mgr
-
-            mock_att_mgr = Mock()
-            mock_att_mgr_class.return_value = mock_att_mgr
-
-            mock_storage = Mock()
-            mock_storage_class.return_value = mock_storage
-
-            result = runner.invoke(
-                main,
-                ["sync", "--output-dir", str(tmp_path / "exports")],
-            )
-
-            assert result.exit_code == 0
-            assert "No completed orders" in result.output or "0" in result.output
+        assert result.exit_code == 0
+        assert "No completed orders" in result.output
 
-    def test_sync_dry_run(self, monkeypatch, tmp_path):
+    def test_sync_dry_run(
+        self, runner, sync_argv, patched_managers,
+        sample_order, transcript_attachment,
+    ):
         """Test sync command with dry-run."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
+        order = sample_order
+        order.attachments = [transcript_attachment]
 
-        runner = CliRunner()
+        mock_order_mgr = patched_managers["order"]
+        mock_order_mgr.get_all_orders.return_value = [order]
+        mock_order_mgr.filter_completed_orders.return_value = [order]
+        mock_order_mgr.get_order_details_bulk.return_value = [order]
 
-        from rev_exporter.models import Order, Attachment
+        mock_att_mgr = patched_managers["att"]
+        mock_att_mgr.classify_attachment.return_value = AttachmentType.TRANSCRIPT
+        mock_att_mgr.get_preferred_format.return_value = "txt"
 
-        order = Order(order_number="12345", status="Complete")
-        order.attachments = [
-            Attachment(id="att_001", name="test.txt", type="transcript"),
-        ]
-
-        with patch("rev_exporter.cli.OrderManager") as mock_order_mgr_class, \
-             patch("rev_exporter.cli.AttachmentManager") as mock_att_mgr_class, \
-             patch("rev_exporter.cli.StorageManager") as mock_storage_class:
-
-            mock_order_mgr = Mock()
-            mock_order_mgr.get_all_orders.return_value = [order]
-            mock_order_mgr.filter_completed_orders.return_value = [order]
-            mock_order_mgr.get_order_details.return_value = order
-            mock_order_mgr_class.return_value = mock_order_mgr
-
-            mock_att_mgr = Mock()
-            mock_att_mgr.classify_attachment.return_value = AttachmentType.TRANSCRIPT
-            mock_att_mgr.get_preferred_format.return_value = "txt"
-            mock_att_mgr_class.return_value = mock_att_mgr
+        mock_storage = patched_managers["storage"]
+        mock_storage.is_downloaded.return_value = False
 
-            mock_storage = Mock()
-            mock_storage.is_downloaded.return_value = False
-            mock_storage_class.return_value = mock_storage
+        result = runner.invoke(main, sync_argv + ["--dry-run"], catch_exceptions=False)
 
-            result = runner.invoke(
-                main,
-                ["sync", "--output-dir", str(tmp_path / "exports"), "--dry-run"],
-            )
-
-            assert result.exit_code == 0
-            assert "DRY RUN" in result.output
-            # Storage should not be called in dry-run
-            mock_storage.save_attachment.assert_not_called()
+        assert result.exit_code == 0
+        assert "DRY RUN" in result.output
+        # Storage should not be called in dry-run
+        mock_storage.save_attachment.assert_not_called()
 
-    def test_sync_with_flags(self, monkeypatch, tmp_path):
+    def test_sync_with_flags(self, runner, sync_argv, patched_managers):
         """Test sync command with various flags."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
-
-        runner = CliRunner()
-
-        with patch("rev_exporter.cli.OrderManager") as mock_order_mgr_class, \
-             patch("rev_exporter.cli.AttachmentManager"), \
-             patch("rev_exporter.cli.StorageManager"):
-
-            mock_order_mgr = Mock()
-            mock_order_mgr.get_all_orders.return_value = []
-            mock_order_mgr.filter_completed_orders.return_value = []
-            mock_order_mgr_class.return_value = mock_order_mgr
-
-            # Test without --since first (it's optional)
-            # Note: --debug is a global option, must come before the command
-            result = runner.invoke(
-                main,
-                [
-                    "--debug",
-                    "sync",
-                    "--output-dir", str(tmp_path / "exports"),
-                    "--no-include-media",
-                ],
-            )
-
-            assert result.exit_code == 0
-
-    def test_sync_keyboard_interrupt(self, monkeypatch, tmp_path):
-        """Test sync command handling keyboard interrupt."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
+        mock_order_mgr = patched_managers["order"]
+        mock_order_mgr.get_all_orders.return_value = []
+        mock_order_mgr.filter_completed_orders.return_value = []
+
+        # Test without --since first (it's optional)
+        # Note: --debug is a global option, must come before the command
+        result = runner.invoke(
+            main,
+            ["--debug"] + sync_argv + ["--no-include-media"],
+            catch_exceptions=False,
+        )
 
-        runner = CliRunner()
+        assert result.exit_code == 0
 
-        with patch("rev_exporter.cli.OrderManager") as mock_order_mgr_class:
-            mock_order_mgr = Mock()
-            mock_order_mgr.get_all_orders.side_effect = KeyboardInterrupt()
-            mock_order_mgr_class.return_value = mock_order_mgr
+    def test_sync_keyboard_interrupt(self, runner, sync_argv, patched_managers):
+        """Test sync command handling keyboard interrupt."""
+        mock_order_mgr = patched_managers["order"]
+        mock_order_mgr.get_all_orders.side_effect = KeyboardInterrupt()
 
-            result = runner.invoke(
-                main,
-                ["sync", "--output-dir", str(tmp_path / "exports")],
-            )
+        result = runner.invoke(main, sync_argv, catch_exceptions=False)
 
-            assert result.exit_code == 1
-            assert "Interrupted" in result.output
+        assert result.exit_code == 1
+        assert "Interrupted" in result.output
 
-    def test_sync_exception_handling(self, monkeypatch, tmp_path):
+    def test_sync_exception_handling(self, runner, sync_argv, patched_managers):
         """Test sync command exception handling."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
+        mock_order_mgr = patched_managers["order"]
+        mock_order_mgr.get_all_orders.side_effect = Exception("Unexpected error")
 
-        runner = CliRunner()
+        result = runner.invoke(main, sync_argv, catch_exceptions=False)
 
-        with patch("rev_exporter.cli.OrderManager") as mock_order_mgr_class:
-            mock_order_mgr = Mock()
-            mock_order_mgr.get_all_orders.side_effect = Exception("Unexpected error")
-            mock_order_mgr_class.return_value = mock_order_mgr
-
-            result = runner.invoke(
-                main,
-                ["sync", "--output-dir", str(tmp_path / "exports")],
-            )
-
-            assert result.exit_code == 1
-            assert "Fatal error" in result.output
+        assert result.exit_code == 1
+        assert "Fatal error" in result.output
 
-    def test_main_debug_flag(self):
+    def test_main_debug_flag(self, runner):
         """Test main command with debug flag."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["--debug", "test-connection", "--help"])
+        result = runner.invoke(main, ["--debug", "test-connection", "--help"], catch_exceptions=False)
         # Should not error, just show help
         assert result.exit_code in [0, 1]  # Help might exit with 1
 
-    def test_test_connection_exception(self, monkeypatch):
+    def test_test_connection_exception(self, mocker, runner):
         """Test test-connection with exception."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
-
-        runner = CliRunner()
-
-        with patch("rev_exporter.cli.RevAPIClient") as mock_client_class:
-            mock_client = Mock()
-            mock_client.test_connection.side_effect = Exception("Unexpected error")
-            mock_client_class.return_value = mock_client
+        mock_client = mocker.patch("rev_exporter.cli.RevAPIClient").return_value
+        mock_client.test_connection.side_effect = Exception("Unexpected error")
 
-            result = runner.invoke(main, ["test-connection"])
-            assert result.exit_code == 1
-            assert "[ERROR]" in result.output
+        result = runner.invoke(main, ["test-connection"], catch_exceptions=False)
+        assert result.exit_code == 1
+        assert "[ERROR]" in result.output
 
-    def test_sync_not_configured(self, monkeypatch, tmp_path):
+    def test_sync_not_configured(self, runner, not_configured_env, sync_argv):
         """Test sync when not configured."""
-        monkeypatch.delenv("REV_CLIENT_API_KEY", raising=False)
-        monkeypatch.delenv("REV_USER_API_KEY", raising=False)
-        monkeypatch.delenv("REV_API_KEY", raising=False)
-        # Mock Path.cwd to prevent loading from docs/key.md
-        monkeypatch.setattr("pathlib.Path.cwd", lambda: tmp_path)
-
-        runner = CliRunner()
-        result = runner.invoke(main, ["sync", "--output-dir", str(tmp_path / "exports")])
+        result = runner.invoke(main, sync_argv, catch_exceptions=False)
         assert result.exit_code == 1
         assert "not configured" in result.output
 
-    def test_sync_with_actual_downloads(self, monkeypatch, tmp_path):
+    def test_sync_with_actual_downloads(
+        self, runner, sync_argv, mock_output_dir, patched_managers,
+        sample_order, transcript_attachment,
+    ):
         """Test sync command with actual file downloads."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
-
-        runner = CliRunner()
-
-        from rev_exporter.models import Order, Attachment
-
-        order = Order(order_number="12345", status="Complete")
-        attachment1 = Attachment(id="att_001", name="transcript.txt", type="transcript")
+        order = sample_order
+        attachment1 = transcript_attachment
         attachment2 = Attachment(id="att_002", name="audio.mp3", type="media")
         order.attachments = [attachment1, attachment2]
 
-        with patch("rev_exporter.cli.OrderManager") as mock_order_mgr_class, \
-             patch("rev_exporter.cli.AttachmentManager") as mock_att_mgr_class, \
-             patch("rev_exporter.cli.StorageManager") as mock_storage_class:
-
-            mock_order_mgr = Mock()
-            mock_order_mgr.get_all_orders.return_value = [order]
-            mock_order_mgr.filter_completed_orders.return_value = [order]
-            mock_order_mgr.get_order_details.return_value = order
-            mock_order_mgr_class.return_value = mock_order_mgr
-
-            mock_att_mgr = Mock()
-            mock_att_mgr.classify_attachment.side_effect = [
-                AttachmentType.TRANSCRIPT,
-                AttachmentType.MEDIA,
-            ]
-            mock_att_mgr.get_preferred_format.return_value = "txt"
-            mock_att_mgr.get_attachment_metadata.return_value = attachment1
-            mock_att_mgr.download_attachment_content.return_value = b"content"
-            mock_att_mgr.get_file_extension.return_value = ".txt"
-            mock_att_mgr_class.return_value = mock_att_mgr
-
-            mock_storage = Mock()
-            mock_storage.is_downloaded.return_value = False
-            mock_storage.save_attachment.return_value = tmp_path / "file.txt"
-            mock_storage_class.return_value = mock_storage
-
-            result = runner.invoke(
-                main,
-                ["sync", "--output-dir", str(tmp_path / "exports")],
-            )
-
-            assert result.exit_code == 0
-            # Verify storage methods were called
-            assert mock_storage.save_order_metadata.called
-            assert mock_storage.save_attachment.called
-            assert mock_storage.mark_downloaded.called
-
-    def test_sync_with_skipped_attachment(self, monkeypatch, tmp_path):
-        """Test sync with already downloaded attachment."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
-
-        runner = CliRunner()
-
-        from rev_exporter.models import Order, Attachment
-
-        order = Order(order_number="12345", status="Complete")
-        attachment = Attachment(id="att_001", name="transcript.txt", type="transcript")
-        order.attachments = [attachment]
-
-        with patch("rev_exporter.cli.OrderManager") as mock_order_mgr_class, \
-             patch("rev_exporter.cli.AttachmentManager") as mock_att_mgr_class, \
-             patch("rev_exporter.cli.StorageManager") as mock_storage_class:
-
-            mock_order_mgr = Mock()
-            mock_order_mgr.get_all_orders.return_value = [order]
-            mock_order_mgr.filter_completed_orders.return_value = [order]
-            mock_order_mgr.get_order_details.return_value = order
-            mock_order_mgr_class.return_value = mock_order_mgr
-
-            mock_att_mgr = Mock()
-            mock_att_mgr_class.return_value = mock_att_mgr
-
-            mock_storage = Mock()
-            mock_storage.is_downloaded.return_value = True  # Already downloaded
-            mock_storage_class.return_value = mock_storage
-
-            result = runner.invoke(
-                main,
-                ["sync", "--output-dir", str(tmp_path / "exports")],
-            )
+        mock_order_mgr = patched_managers["order"]
+        mock_order_mgr.get_all_orders.return_value = [order]
+        mock_order_mgr.filter_completed_orders.return_value = [order]
+        mock_order_mgr.get_order_details_bulk.return_value = [order]
 
-            assert result.exit_code == 0
-            # Should skip download
-            mock_storage.save_attachment.assert_not_called()
-
-    def test_sync_with_attachment_error(self, monkeypatch, tmp_path):
-        """Test sync with attachment download error."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
+        mock_att_mgr = patched_managers["att"]
+        mock_att_mgr.classify_attachment.side_effect = [
+            AttachmentType.TRANSCRIPT,
+            AttachmentType.MEDIA,
+        ]
+        mock_att_mgr.get_preferred_format.return_value = "txt"
+        mock_att_mgr.get_attachment_metadata.return_value = attachment1
+        mock_att_mgr.download_attachment_content.return_value = b"content"
+        mock_att_mgr.get_file_extension.return_value = ".txt"
 
-        runner = CliRunner()
+        mock_storage = patched_managers["storage"]
+        mock_storage.is_downloaded.return_value = False
+        mock_storage.save_attachment.return_value = mock_output_dir / "file.txt"
 
-        from rev_exporter.models import Order, Attachment
+        result = runner.invoke(main, sync_argv, catch_exceptions=False)
 
-        order = Order(order_number="12345", status="Complete")
-        attachment = Attachment(id="att_001", name="transcript.txt", type="transcript")
+        assert result.exit_code == 0
+        # Verify storage methods were called
+        assert mock_storage.save_order_metadata.called
+        assert mock_storage.save_attachment.called
+        assert mock_storage.mark_downloaded.called
+
+    @pytest.mark.parametrize(
+        "flag,att_type,is_downloaded,download_error",
+        [
+            # --no-include-media filters media out
+            ("--no-include-media", AttachmentType.MEDIA, False, False),
+            # --no-include-transcripts filters transcripts out
+            ("--no-include-transcripts", AttachmentType.TRANSCRIPT, False, False),
+            # already-downloaded attachments are skipped
+            (None, AttachmentType.TRANSCRIPT, True, False),
+            # download errors are reported and nothing is saved
+            (None, AttachmentType.TRANSCRIPT, False, True),
+        ],
+    )
+    def test_sync_skips_attachment(
+        self, runner, sync_argv, patched_managers,
+        sample_order, transcript_attachment,
+        flag, att_type, is_downloaded, download_error,
+    ):
+        """Test sync paths where an attachment must not be saved."""
+        order = sample_order
+        if att_type == AttachmentType.MEDIA:
+            attachment = Attachment(id="att_001", name="audio.mp3", type="media")
+        else:
+            attachment = transcript_attachment
         order.attachments = [attachment]
 
-        with patch("rev_exporter.cli.OrderManager") as mock_order_mgr_class, \
-             patch("rev_exporter.cli.AttachmentManager") as mock_att_mgr_class, \
-             patch("rev_exporter.cli.StorageManager") as mock_storage_class:
+        mock_order_mgr = patched_managers["order"]
+        mock_order_mgr.get_all_orders.return_value = [order]
+        mock_order_mgr.filter_completed_orders.return_value = [order]
+        mock_order_mgr.get_order_details_bulk.return_value = [order]
 
-            mock_order_mgr = Mock()
-            mock_order_mgr.get_all_orders.return_value = [order]
-            mock_order_mgr.filter_completed_orders.return_value = [order]
-            mock_order_mgr.get_order_details.return_value = order
-            mock_order_mgr_class.return_value = mock_order_mgr
-
-            mock_att_mgr = Mock()
-            mock_att_mgr.classify_attachment.return_value = AttachmentType.TRANSCRIPT
+        mock_att_mgr = patched_managers["att"]
+        mock_att_mgr.classify_attachment.return_value = att_type
+        if download_error:
             mock_att_mgr.get_preferred_format.return_value = "txt"
             mock_att_mgr.get_attachment_metadata.side_effect = Exception("Download failed")
-            mock_att_mgr_class.return_value = mock_att_mgr
 
-            mock_storage = Mock()
-            mock_storage.is_downloaded.return_value = False
-            mock_storage_class.return_value = mock_storage
+        mock_storage = patched_managers["storage"]
+        mock_storage.is_downloaded.return_value = is_downloaded
 
-            result = runner.invoke(
-                main,
-                ["sync", "--output-dir", str(tmp_path / "exports")],
-            )
+        args = sync_argv + [flag] if flag else sync_argv
+        result = runner.invoke(main, args, catch_exceptions=False)
 
-            assert result.exit_code == 0
-            assert "Failed" in result.output or "failures" in result.output.lower()
+        assert result.exit_code == 0
+        if download_error:
+            assert _FAILED_RE.search(result.output)
+        mock_storage.save_attachment.assert_not_called()
 
-    def test_sync_with_order_error(self, monkeypatch, tmp_path):
+    def test_sync_with_order_error(
+        self, runner, sync_argv, patched_managers, sample_order
+    ):
         """Test sync with order processing error."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
-
-        runner = CliRunner()
+        order = sample_order
 
-        from rev_exporter.models import Order
+        mock_order_mgr = patched_managers["order"]
+        mock_order_mgr.get_all_orders.return_value = [order]
+        mock_order_mgr.filter_completed_orders.return_value = [order]
+        mock_order_mgr.get_order_details_bulk.return_value = [Exception("Order error")]
 
-        order = Order(order_number="12345", status="Complete")
+        result = runner.invoke(main, sync_argv, catch_exceptions=False)
 
-        with patch("rev_exporter.cli.OrderManager") as mock_order_mgr_class, \
-             patch("rev_exporter.cli.AttachmentManager"), \
-             patch("rev_exporter.cli.StorageManager"):
-
-            mock_order_mgr = Mock()
-            mock_order_mgr.get_all_orders.return_value = [order]
-            mock_order_mgr.filter_completed_orders.return_value = [order]
-            mock_order_mgr.get_order_details.side_effect = Exception("Order error")
-            mock_order_mgr_class.return_value = mock_order_mgr
-
-            result = runner.invoke(
-                main,
-                ["sync", "--output-dir", str(tmp_path / "exports")],
-            )
-
-            assert result.exit_code == 0
-            assert "Failed" in result.output or "failures" in result.output.lower()
+        assert result.exit_code == 0
+        assert _FAILED_RE.search(result.output)
 
-    def test_sync_summary_with_failures(self, monkeypatch, tmp_path):
+    def test_sync_summary_with_failures(
+        self, runner, sync_argv, patched_managers, sample_order
+    ):
         """Test sync summary output with failures."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
-
-        runner = CliRunner()
-
-        from rev_exporter.models import Order
-
-        order = Order(order_number="12345", status="Complete")
+        order = sample_order
         order.attachments = []
 
-        with patch("rev_exporter.cli.OrderManager") as mock_order_mgr_class, \
-             patch("rev_exporter.cli.AttachmentManager"), \
-             patch("rev_exporter.cli.StorageManager"):
-
-            mock_order_mgr = Mock()
-            mock_order_mgr.get_all_orders.return_value = [order]
-            mock_order_mgr.filter_completed_orders.return_value = [order]
-            mock_order_mgr.get_order_details.return_value = order
-            mock_order_mgr_class.return_value = mock_order_mgr
-
-            result = runner.invoke(
-                main,
-                ["sync", "--output-dir", str(tmp_path / "exports")],
-            )
-
-            assert result.exit_code == 0
-            assert "SYNC SUMMARY" in result.output
-
-    def test_sync_exclude_media(self, monkeypatch, tmp_path):
-        """Test sync with media excluded."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
-
-        runner = CliRunner()
-
-        from rev_exporter.models import Order, Attachment
-
-        order = Order(order_number="12345", status="Complete")
-        attachment = Attachment(id="att_001", name="audio.mp3", type="media")
-        order.attachments = [attachment]
-
-        with patch("rev_exporter.cli.OrderManager") as mock_order_mgr_class, \
-             patch("rev_exporter.cli.AttachmentManager") as mock_att_mgr_class, \
-             patch("rev_exporter.cli.StorageManager") as mock_storage_class:
-
-            mock_order_mgr = Mock()
-            mock_order_mgr.get_all_orders.return_value = [order]
-            mock_order_mgr.filter_completed_orders.return_value = [order]
-            mock_order_mgr.get_order_details.return_value = order
-            mock_order_mgr_class.return_value = mock_order_mgr
+        mock_order_mgr = patched_managers["order"]
+        mock_order_mgr.get_all_orders.return_value = [order]
+        mock_order_mgr.filter_completed_orders.return_value = [order]
+        mock_order_mgr.get_order_details_bulk.return_value = [order]
 
-            mock_att_mgr = Mock()
-            mock_att_mgr.classify_attachment.return_value = AttachmentType.MEDIA
-            mock_att_mgr_class.return_value = mock_att_mgr
+        result = runner.invoke(main, sync_argv, catch_exceptions=False)
 
-            mock_storage = Mock()
-            mock_storage.is_downloaded.return_value = False
-            mock_storage_class.return_value = mock_storage
-
-            result = runner.invoke(
-                main,
-                ["sync", "--output-dir", str(tmp_path / "exports"), "--no-include-media"],
-            )
-
-            assert result.exit_code == 0
-            # Media should be skipped
-            mock_storage.save_attachment.assert_not_called()
-
-    def test_sync_exclude_transcripts(self, monkeypatch, tmp_path):
-        """Test sync with transcripts excluded."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
-
-        runner = CliRunner()
-
-        from rev_exporter.models import Order, Attachment
-
-        order = Order(order_number="12345", status="Complete")
-        attachment = Attachment(id="att_001", name="transcript.txt", type="transcript")
-        order.attachments = [attachment]
-
-        with patch("rev_exporter.cli.OrderManager") as mock_order_mgr_class, \
-             patch("rev_exporter.cli.AttachmentManager") as mock_att_mgr_class, \
-             patch("rev_exporter.cli.StorageManager") as mock_storage_class:
-
-            mock_order_mgr = Mock()
-            mock_order_mgr.get_all_orders.return_value = [order]
-            mock_order_mgr.filter_completed_orders.return_value = [order]
-            mock_order_mgr.get_order_details.return_value = order
-            mock_order_mgr_class.return_value = mock_order_mgr
-
-            mock_att_mgr = Mock()
-            mock_att_mgr.classify_attachment.return_value = AttachmentType.TRANSCRIPT
-            mock_att_mgr_class.return_value = mock_att_mgr
-
-            mock_storage = Mock()
-            mock_storage.is_downloaded.return_value = False
-            mock_storage_class.return_value = mock_storage
-
-            result = runner.invoke(
-                main,
-                ["sync", "--output-dir", str(tmp_path / "exports"), "--no-include-transcripts"],
-            )
-
-            assert result.exit_code == 0
-            # Transcripts should be skipped
-            mock_storage.save_attachment.assert_not_called()
+        assert result.exit_code == 0
+        assert "SYNC SUMMARY" in result.output
 
-    def test_sync_many_failures(self, monkeypatch, tmp_path):
+    def test_sync_many_failures(
+        self, runner, sync_argv, patched_managers,
+        sample_order, many_failing_attachments,
+    ):
         """Test sync summary with many failures (>10)."""
-        monkeypatch.setenv("REV_CLIENT_API_KEY", "test_client")
-        monkeypatch.setenv("REV_USER_API_KEY", "test_user")
+        order = sample_order
+        # Shallow copy so the module-scoped fixture is never mutated
+        order.attachments = list(many_failing_attachments)
 
-        runner = CliRunner()
+        mock_order_mgr = patched_managers["order"]
+        mock_order_mgr.get_all_orders.return_value = [order]
+        mock_order_mgr.filter_completed_orders.return_value = [order]
+        mock_order_mgr.get_order_details_bulk.return_value = [order]
 
-        from rev_exporter.models import Order, Attachment
+        mock_att_mgr = patched_managers["att"]
+        mock_att_mgr.classify_attachment.return_value = AttachmentType.TRANSCRIPT
+        mock_att_mgr.get_preferred_format.return_value = "txt"
+        mock_att_mgr.get_attachment_metadata.side_effect = Exception("Download failed")
 
-        order = Order(order_number="12345", status="Complete")
-        # Create 15 attachments that will all fail
-        order.attachments = [
-            Attachment(id=f"att_{i:03d}", name=f"file_{i}.txt", type="transcript")
-            for i in range(15)
-        ]
-
-        with patch("rev_exporter.cli.OrderManager") as mock_order_mgr_class, \
-             patch("rev_exporter.cli.AttachmentManager") as mock_att_mgr_class, \
-             patch("rev_exporter.cli.StorageManager") as mock_storage_class:
+        mock_storage = patched_managers["storage"]
+        mock_storage.is_downloaded.return_value = False
 
-            mock_order_mgr = Mock()
-            mock_order_mgr.get_all_orders.return_value = [order]
-            mock_order_mgr.filter_completed_orders.return_value = [order]
-            mock_order_mgr.get_order_details.return_value = order
-            mock_order_mgr_class.return_value = mock_order_mgr
+        result = runner.invoke(main, sync_argv, catch_exceptions=False)
 
-            mock_att_mgr = Mock()
-            mock_att_mgr.classify_attachment.return_value = AttachmentType.TRANSCRIPT
-            mock_att_mgr.get_preferred_format.return_value = "txt"
-            mock_att_mgr.get_attachment_metadata.side_effect = Exception("Download failed")
-            mock_att_mgr_class.return_value = mock_att_mgr
-
-            mock_storage = Mock()
-            mock_storage.is_downloaded.return_value = False
-            mock_storage_class.return_value = mock_storage
-
-            result = runner.invoke(
-                main,
-                ["sync", "--output-dir", str(tmp_path / "exports")],
-            )
-
-            assert result.exit_code == 0
-            # Should show "... and X more" message
-            assert "... and" in result.output or "more" in result.output.lower()
+        assert result.exit_code == 0
+        # 15 failures, first 10 shown, remainder summarized
+        assert "... and 5 more" in result.output
 
@@ -3,12 +3,20 @@ Unit tests for client module.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from requests.exceptions import RequestException, HTTPError
-from requests import Response
+from unittest.mock import Mock, patch
+from requests.exceptions import RequestException
 
 from rev_exporter.client import RevAPIClient, RevAPIError
-from rev_exporter.config import Config
+
+
+@pytest.fixture(scope="module")
+def client(mock_api_client):
+    """One configured client shared by the whole module.
+
+    The requests-mock fixture intercepts at the transport layer, so the
+    shared client (and its Session) works for the request tests too.
+    """
+    return mock_api_client
 
 
 class TestRevAPIClient:
@@ -26,85 +34,69 @@ class TestRevAPIClient:
         client = RevAPIClient(config=mock_config_unconfigured)
         assert client.config == mock_config_unconfigured
 
-    def test_get_json_response(self, mock_config, mock_requests_response):
-        """Test GET request with JSON response."""
-        client = RevAPIClient(config=mock_config)
-        json_data = {"key": "value"}
-
-        with patch.object(client.session, "request") as mock_request:
-            mock_response = mock_requests_response(json_data=json_data)
-            mock_request.return_value = mock_response
-
-            result = client.get("/test")
-            assert result == json_data
-
-    def test_get_binary_response(self, mock_config, mock_requests_response):
-        """Test GET request with binary response."""
-        client = RevAPIClient(config=mock_config)
-        binary_data = b"binary content"
-
-        with patch.object(client.session, "request") as mock_request:
-            mock_response = mock_requests_response(content=binary_data)
-            mock_request.return_value = mock_response
-
-            result = client.get("/test", stream=True)
-            assert result == binary_data
-
-    def test_get_with_params(self, mock_config, mock_requests_response):
-        """Test GET request with parameters."""
-        client = RevAPIClient(config=mock_config)
-
-        with patch.object(client.session, "request") as mock_request:
-            mock_response = mock_requests_response(json_data={})
-            mock_request.return_value = mock_response
-
-            client.get("/test", params={"page": 1, "limit": 10})
-            call_args = mock_request.call_args
-            assert call_args[1]["params"] == {"page": 1, "limit": 10}
-
-    def test_get_request_exception(self, mock_config):
-        """Test GET request with RequestException."""
-        client = RevAPIClient(config=mock_config)
-
-        with patch.object(client.session, "request") as mock_request:
-            mock_request.side_effect = RequestException("Network error")
-
-            with pytest.raises(RevAPIError, match="API request failed"):
-                client.get("/test")
-
-    def test_get_http_error(self, mock_config, mock_requests_response):
-        """Test GET request with HTTP error."""
-        client = RevAPIClient(config=mock_config)
-
-        with patch.object(client.session, "request") as mock_request:
-            mock_response = mock_requests_response(status_code=404)
-            mock_response.raise_for_status.side_effect = HTTPError("Not found")
-            mock_request.return_value = mock_response
-
-            with pytest.raises(RevAPIError):
-                client.get("/test")
-
-    def test_post_request(self, mock_config, mock_requests_response):
-        """Test POST request."""
-        client = RevAPIClient(config=mock_config)
-        json_data = {"result": "success"}
-
-        with patch.object(client.session, "post") as mock_post:
-            mock_response = mock_requests_response(json_data=json_data)
-            mock_post.return_value = mock_response
-
-            result = client.post("/test", json_data={"key": "value"})
-            assert result == json_data
-
-    def test_post_request_exception(self, mock_config):
-        """Test POST request with exception."""
-        client = RevAPIClient(config=mock_config)
-
-        with patch.object(client.session, "post") as mock_post:
-            mock_post.side_effect = RequestException("Error")
-
-            with pytest.raises(RevAPIError):
-                client.post("/test", json_data={})
+    @pytest.mark.parametrize(
+        "http_method,response_kwargs,call_kwargs,expected",
+        [
+            pytest.param("get", {"json": {"key": "value"}}, {}, {"key": "value"}, id="get-json"),
+            pytest.param("get", {"content": b"binary content"}, {"stream": True}, b"binary content", id="get-binary"),
+            pytest.param("get", {"json": {}}, {"params": {"page": 1, "limit": 10}}, {}, id="get-params"),
+            pytest.param("post", {"json": {"result": "success"}}, {"json_data": {"key": "value"}}, {"result": "success"}, id="post-json"),
+        ],
+    )
+    def test_request_success(
+        self, client, requests_mock, http_method, response_kwargs, call_kwargs, expected
+    ):
+        """Test successful GET/POST requests against a mocked transport."""
+        getattr(requests_mock, http_method)(f"{client.BASE_URL}/test", **response_kwargs)
+
+        result = getattr(client, http_method)("/test", **call_kwargs)
+        assert result == expected
+        if "params" in call_kwargs:
+            assert requests_mock.last_request.qs == {"page": ["1"], "limit": ["10"]}
+        if "json_data" in call_kwargs:
+            assert requests_mock.last_request.json() == call_kwargs["json_data"]
+
+    @pytest.mark.parametrize(
+        "http_method,response_kwargs,match",
+        [
+            pytest.param("get", {"exc": RequestException("Network error")}, "API request failed", id="get-exception"),
+            pytest.param("get", {"status_code": 404}, None, id="get-http-error"),
+            pytest.param("post", {"exc": RequestException("Error")}, None, id="post-exception"),
+        ],
+    )
+    def test_request_error(self, client, requests_mock, http_method, response_kwargs, match):
+        """Test that transport failures and HTTP errors raise RevAPIError."""
+        getattr(requests_mock, http_method)(f"{client.BASE_URL}/test", **response_kwargs)
+
+        call_kwargs = {"json_data": {}} if http_method == "post" else {}
+        with pytest.raises(RevAPIError, match=match):
+            getattr(client, http_method)("/test", **call_kwargs)
+
+    @pytest.mark.parametrize(
+        "http_method,headers,expected_header,expected_value",
+        [
+            pytest.param("get", {"Custom-Header": "value"}, "Custom-Header", "value", id="get-custom"),
+            pytest.param("get", {}, "Authorization", None, id="get-auth-added"),
+            pytest.param("post", {"Custom-Header": "value"}, "Custom-Header", "value", id="post-custom"),
+            pytest.param("post", {"Authorization": "existing"}, "Authorization", "existing", id="post-auth-kept"),
+        ],
+    )
+    def test_request_headers(
+        self, client, requests_mock, http_method, headers, expected_header, expected_value
+    ):
+        """Test header handling: custom headers pass through, auth is filled in."""
+        getattr(requests_mock, http_method)(f"{client.BASE_URL}/test", json={})
+
+        if http_method == "post":
+            client.post("/test", headers=headers, json_data={})
+        else:
+            client._make_request("GET", "/test", headers=headers)
+
+        sent = requests_mock.last_request.headers
+        if expected_value is None:
+            assert expected_header in sent
+        else:
+            assert sent[expected_header] == expected_value
 
     def test_parse_json_response_invalid(self, mock_config):
         """Test parsing invalid JSON response."""
@@ -115,84 +107,21 @@ class TestRevAPIClient:
         with pytest.raises(RevAPIError, match="Invalid JSON response"):
             client._parse_json_response(mock_response)
 
-    def test_test_connection_success(self, mock_config, mock_requests_response):
-        """Test successful connection test."""
-        client = RevAPIClient(config=mock_config)
-
-        with patch.object(client, "get") as mock_get:
-            mock_get.return_value = {"orders": []}
-            result = client.test_connection()
-            assert result is True
-
-    def test_test_connection_failure(self, mock_config):
-        """Test failed connection test."""
-        client = RevAPIClient(config=mock_config)
-
-        with patch.object(client, "get") as mock_get:
-            mock_get.side_effect = RevAPIError("Connection failed")
-            result = client.test_connection()
-            assert result is False
+    @pytest.mark.parametrize(
+        "get_behavior,expected",
+        [
+            pytest.param({"return_value": {"orders": []}}, True, id="success"),
+            pytest.param({"side_effect": RevAPIError("Connection failed")}, False, id="api-error"),
+            pytest.param({"side_effect": ValueError("Unexpected error")}, False, id="unexpected-error"),
+        ],
+    )
+    def test_test_connection(self, client, get_behavior, expected):
+        """Test connection check outcomes."""
+        with patch.object(client, "get", **get_behavior):
+            assert client.test_connection() is expected
 
     def test_test_connection_unconfigured(self, mock_config_unconfigured):
         """Test connection test when not configured."""
         client = RevAPIClient(config=mock_config_unconfigured)
         result = client.test_connection()
         assert result is False
-
-    def test_make_request_with_headers(self, mock_config, mock_requests_response):
-        """Test _make_request with custom headers."""
-        client = RevAPIClient(config=mock_config)
-
-        with patch.object(client.session, "request") as mock_request:
-            mock_response = mock_requests_response(json_data={})
-            mock_request.return_value = mock_response
-
-            client._make_request("GET", "/test", headers={"Custom-Header": "value"})
-            call_args = mock_request.call_args
-            assert call_args[1]["headers"]["Custom-Header"] == "value"
-
-    def test_make_request_with_auth_header(self, mock_config, mock_requests_response):
-        """Test _make_request adds auth header when missing."""
-        client = RevAPIClient(config=mock_config)
-
-        with patch.object(client.session, "request") as mock_request:
-            mock_response = mock_requests_response(json_data={})
-            mock_request.return_value = mock_response
-
-            client._make_request("GET", "/test", headers={})
-            call_args = mock_request.call_args
-            assert "Authorization" in call_args[1]["headers"]
-
-    def test_post_with_custom_headers(self, mock_config, mock_requests_response):
-        """Test POST with custom headers."""
-        client = RevAPIClient(config=mock_config)
-
-        with patch.object(client.session, "post") as mock_post:
-            mock_response = mock_requests_response(json_data={})
-            mock_post.return_value = mock_response
-
-            client.post("/test", headers={"Custom-Header": "value"}, json_data={})
-            call_args = mock_post.call_args
-            assert call_args[1]["headers"]["Custom-Header"] == "value"
-
-    def test_post_with_existing_auth(self, mock_config, mock_requests_response):
-        """Test POST with existing auth header."""
-        client = RevAPIClient(config=mock_config)
-
-        with patch.object(client.session, "post") as mock_post:
-            mock_response = mock_requests_response(json_data={})
-            mock_post.return_value = mock_response
-
-            client.post("/test", headers={"Authorization": "existing"}, json_data={})
-            call_args = mock_post.call_args
-            assert call_args[1]["headers"]["Authorization"] == "existing"
-
-    def test_test_connection_unexpected_exception(self, mock_config):
-        """Test connection test with unexpected exception."""
-        client = RevAPIClient(config=mock_config)
-
-        with patch.object(client, "get") as mock_get:
-            mock_get.side_effect = ValueError("Unexpected error")
-            result = client.test_connection()
-            assert result is False
-
@@ -2,13 +2,73 @@
 Unit tests for logging_config module.
 """
 
+import io
 import logging
 import sys
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 from rev_exporter.logging_config import setup_logging, SensitiveDataFilter
 
 
+# setup_logging rebuilds the root handlers on each call, so configure each
+# variant once per session and let the read-only tests share the result.
+# (Tests in this file run in order within one xdist worker.)
+
+@pytest.fixture(scope="session")
+def default_logging():
+    """Root logger configured with defaults."""
+    setup_logging()
+    return logging.getLogger()
+
+
+@pytest.fixture(scope="session")
+def debug_logging():
+    """Root logger configured with debug enabled."""
+    setup_logging(debug=True)
+    return logging.getLogger()
+
+
+@pytest.fixture(scope="session")
+def warning_logging():
+    """Root logger configured at WARNING level."""
+    setup_logging(level=logging.WARNING)
+    return logging.getLogger()
+
+
+@pytest.fixture(scope="session")
+def file_logging():
+    """Root logger configured with a log file backed by an in-memory stream.
+
+    FileHandler._open is patched to return a StringIO, so the handler
+    wiring is the real thing but no file descriptor or disk write is
+    involved.
+    """
+    mp = pytest.MonkeyPatch()
+    stream = io.StringIO()
+    mp.setattr(logging.FileHandler, "_open", lambda self: stream)
+    setup_logging(log_file="unused.log")
+    mp.undo()
+    root = logging.getLogger()
+    yield root
+    for handler in root.handlers[:]:
+        if isinstance(handler, logging.FileHandler):
+            handler.close()
+            root.removeHandler(handler)
+
+
+@pytest.fixture
+def restore_root_handlers():
+    """Snapshot and restore root logger state for mutating tests."""
+    root = logging.getLogger()
+    saved_handlers = root.handlers[:]
+    saved_level = root.level
+    yield root
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+
+
 class TestSensitiveDataFilter:
     """Test SensitiveDataFilter class."""
 
@@ -65,56 +125,61 @@ class TestSensitiveDataFilter:
         result = filter_obj.filter(record)
         assert result is False
 
+    @pytest.mark.parametrize("pattern", SensitiveDataFilter.SENSITIVE_PATTERNS)
+    def test_filter_all_patterns(self, pattern):
+        """Test that every listed pattern survives the compiled alternation."""
+        filter_obj = SensitiveDataFilter()
+
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg=f"value of {pattern} leaked",
+            args=(),
+            exc_info=None,
+        )
+
+        assert filter_obj.filter(record) is False
+
 
 class TestSetupLogging:
     """Test setup_logging function."""
 
-    def test_setup_logging_default(self):
+    def test_setup_logging_default(self, default_logging):
         """Test setting up logging with default settings."""
-        setup_logging()
-        root_logger = logging.getLogger()
+        assert default_logging.level == logging.INFO
+        assert len(default_logging.handlers) > 0
 
-        assert root_logger.level == logging.INFO
-        assert len(root_logger.handlers) > 0
-
-    def test_setup_logging_debug(self):
+    def test_setup_logging_debug(self, debug_logging):
         """Test setting up logging with debug enabled."""
-        setup_logging(debug=True)
-        root_logger = logging.getLogger()
-
-        assert root_logger.level == logging.DEBUG
+        assert debug_logging.level == logging.DEBUG
 
-    def test_setup_logging_custom_level(self):
+    def test_setup_logging_custom_level(self, warning_logging):
         """Test setting up logging with custom level."""
-        setup_logging(level=logging.WARNING)
-        root_logger = logging.getLogger()
+        assert warning_logging.level == logging.WARNING
 
-        assert root_logger.level == logging.WARNING
-
-    def test_setup_logging_with_file(self, tmp_path):
+    def test_setup_logging_with_file(self, file_logging):
         """Test setting up logging with log file."""
-        log_file = tmp_path / "test.log"
-        setup_logging(log_file=str(log_file))
-
-        root_logger = logging.getLogger()
         file_handlers = [
-            h for h in root_logger.handlers
+            h for h in file_logging.handlers
             if isinstance(h, logging.FileHandler)
         ]
         assert len(file_handlers) > 0
 
-    def test_setup_logging_removes_existing_handlers(self):
+        file_logging.error("log file smoke test")
+        assert "log file smoke test" in file_handlers[0].stream.getvalue()
+
+    def test_setup_logging_removes_existing_handlers(self, restore_root_handlers):
         """Test that setup_logging removes existing handlers."""
-        root_logger = logging.getLogger()
-        original_handlers = root_logger.handlers[:]
+        root_logger = restore_root_handlers
 
         setup_logging()
         # Should have cleared and added new handlers
         assert len(root_logger.handlers) >= 1
 
-    def test_setup_logging_suppresses_third_party(self):
+    def test_setup_logging_suppresses_third_party(self, default_logging):
         """Test that third-party loggers are suppressed."""
-        setup_logging()
         urllib3_logger = logging.getLogger("urllib3")
         assert urllib3_logger.level >= logging.WARNING
 
@@ -80,29 +80,83 @@ class TestOrder:
         order = Order(order_number="1", status="Pending")
         assert order.attachments == []
 
-    def test_placed_on_parsing(self):
+    @pytest.mark.parametrize(
+        "placed_on, microsecond",
+        [
+            ("2024-01-15T10:30:00Z", 0),
+            ("2024-01-15T10:30:00.123Z", 123000),
+            ("2024-01-15T10:30:00.123456Z", 123456),
+        ],
+    )
+    def test_placed_on_parsing(self, placed_on, microsecond):
         """Test parsing placed_on datetime."""
         data = {
             "order_number": "1",
             "status": "Complete",
-            "placed_on": "2024-01-15T10:30:00Z",
+            "placed_on": placed_on,
         }
         order = Order.from_api_response(data)
         assert isinstance(order.placed_on, datetime)
         assert order.placed_on.year == 2024
         assert order.placed_on.month == 1
         assert order.placed_on.day == 15
-
-    def test_placed_on_invalid_format(self):
+        assert order.placed_on.microsecond == microsecond
+
+    @pytest.mark.parametrize(
+        "placed_on",
+        [
+            "invalid-date",  # rejected by the shape guard
+            "2024-01-15T99:99:99Z",  # canonical shape, out-of-range fields
+            "2024-01-15T99:99:99",  # ISO-shaped but unparseable
+            "2024-01-15T10:30:00x123Z",  # fractional part without the dot
+            " 123-01-15T10:30:00Z",  # whitespace int() would swallow
+            "+123-01-15T10:30:00Z",  # sign int() would swallow
+            "2024-01-15T10:30:00.1_2Z",  # underscore int() would swallow
+        ],
+    )
+    def test_placed_on_invalid_format(self, placed_on):
         """Test handling invalid placed_on format."""
         data = {
             "order_number": "1",
             "status": "Complete",
-            "placed_on": "invalid-date",
+            "placed_on": placed_on,
         }
         order = Order.from_api_response(data)
         assert order.placed_on is None
 
+    def test_is_completed_after_status_change(self):
+        """Test that is_completed tracks post-construction mutation."""
+        order = Order(order_number="1", status="Pending")
+        assert order.is_completed() is False
+        assert order.is_completed() is False  # cached path
+
+        order.status = "Complete"
+        assert order.is_completed() is True
+
+    def test_from_api_response_non_string_status(self):
+        """Test that a malformed status is stored as-is."""
+        order = Order.from_api_response({"order_number": "1", "status": None})
+        assert order.status is None
+
+    def test_from_api_response_missing_fields(self):
+        """Test creating Order from an empty response."""
+        order = Order.from_api_response({})
+        assert order.order_number == ""
+        assert order.status == ""
+        assert order.placed_on is None
+        assert order.attachments == []
+
+    def test_placed_on_instances_shared(self):
+        """Test that identical timestamps share one datetime instance."""
+        data = {
+            "order_number": "1",
+            "status": "Complete",
+            "placed_on": "2024-01-15T10:30:00Z",
+        }
+        first = Order.from_api_response(data)
+        second = Order.from_api_response({**data, "order_number": "2"})
+        assert first.placed_on is second.placed_on
+
     def test_metadata_stored(self, sample_order_data):
         """Test that full metadata is stored."""
         order = Order.from_api_response(sample_order_data)
@@ -170,6 +170,62 @@ class TestOrderManager:
             assert len(order.attachments) == 2
             mock_get.assert_called_once_with("/orders/12345")
 
+    def test_get_order_details_bulk(self, mock_api_client, sample_order_data):
+        """Test getting details for many orders concurrently."""
+        manager = OrderManager(mock_api_client)
+
+        assert manager.get_order_details_bulk([]) == []
+
+        with patch.object(mock_api_client, "get") as mock_get:
+            mock_get.return_value = sample_order_data
+            orders = manager.get_order_details_bulk(["12345", "12346"])
+
+            assert len(orders) == 2
+            assert all(isinstance(o, Order) for o in orders)
+            assert mock_get.call_count == 2
+
+    def test_get_order_details_cached(self, mock_api_client, sample_order_data):
+        """Test that repeat detail lookups hit the cache."""
+        manager = OrderManager(mock_api_client)
+
+        with patch.object(mock_api_client, "get") as mock_get:
+            mock_get.return_value = sample_order_data
+            first = manager.get_order_details("12345")
+            second = manager.get_order_details("12345")
+
+            assert second is first
+            assert mock_get.call_count == 1
+
+            # refresh bypasses the cache
+            manager.get_order_details("12345", refresh=True)
+            assert mock_get.call_count == 2
+
+            # targeted and full invalidation both force a re-fetch
+            manager.invalidate("12345")
+            manager.get_order_details("12345")
+            assert mock_get.call_count == 3
+
+            manager.invalidate()
+            manager.get_order_details("12345")
+            assert mock_get.call_count == 4
+
+    def test_get_order_details_bulk_keeps_errors(self, mock_api_client, sample_order_data):
+        """Test that one failing order doesn't abort the batch."""
+        from rev_exporter.client import RevAPIError
+
+        manager = OrderManager(mock_api_client)
+
+        def fake_get(path):
+            if path.endswith("/bad"):
+                raise RevAPIError("API error")
+            return sample_order_data
+
+        with patch.object(mock_api_client, "get", side_effect=fake_get):
+            results = manager.get_order_details_bulk(["12345", "bad"])
+
+            assert isinstance(results[0], Order)
+            assert isinstance(results[1], RevAPIError)
+
     def test_get_order_details_error(self, mock_api_client):
         """Test get_order_details with API error."""
         manager = OrderManager(mock_api_client)
@@ -260,6 +316,51 @@ class TestOrderManager:
             # Should stop early when order is older than since_date
             assert len(orders) == 0  # Order is older, so should be filtered out and stop
 
+    def test_get_all_orders_with_since_stops_on_later_page(self, mock_api_client):
+        """Test that the since filter stops mid-pagination on a later page."""
+        from datetime import timezone
+        manager = OrderManager(mock_api_client)
+
+        since_date = datetime(2024, 1, 16, tzinfo=timezone.utc)
+
+        page1 = {
+            "total_count": 3,
+            "results_per_page": 1,
+            "page": 0,
+            "orders": [
+                {"order_number": "3", "status": "Complete", "placed_on": "2024-01-18T10:00:00Z"},
+            ],
+        }
+
+        page2 = {
+            "total_count": 3,
+            "results_per_page": 1,
+            "page": 1,
+            "orders": [
+                {"order_number": "2", "status": "Complete", "placed_on": "2024-01-15T10:00:00Z"},
+            ],
+        }
+
+        page3 = {
+            "total_count": 3,
+            "results_per_page": 1,
+            "page": 2,
+            "orders": [
+                {"order_number": "1", "status": "Complete", "placed_on": "2024-01-14T10:00:00Z"},
+            ],
+        }
+
+        with patch.object(mock_api_client, "get") as mock_get:
+            mock_get.side_effect = [page1, page2, page3]
+            orders = manager.get_all_orders(since=since_date, results_per_page=1)
+
+            # Page 2's order is older than since_date, so pagination stops
+            # there; the one-page lookahead means page 3 may be fetched but
+            # its orders are never returned
+            assert len(orders) == 1
+            assert orders[0].order_number == "3"
+            assert mock_get.call_count <= 3
+
     def test_get_all_orders_timezone_normalization_naive_since(self, mock_api_client):
         """Test timezone normalization when since is naive."""
         from datetime import timezone
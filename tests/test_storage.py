@@ -62,6 +62,19 @@ class TestStorageManager:
         assert storage.is_downloaded("att_001") is True
         assert storage.is_downloaded("att_002") is False
 
+    def test_is_downloaded_with_bloom(self, temp_output_dir):
+        """Test the Bloom-filtered membership check."""
+        storage = StorageManager(temp_output_dir, use_bloom=True)
+        storage.mark_downloaded("att_001")
+
+        assert storage.is_downloaded("att_001") is True
+        assert storage.is_downloaded("att_002") is False
+
+        # The filter is rebuilt from the index on load
+        reloaded = StorageManager(temp_output_dir, use_bloom=True)
+        assert reloaded.is_downloaded("att_001") is True
+        assert reloaded.is_downloaded("att_002") is False
+
     def test_mark_downloaded(self, temp_output_dir):
         """Test marking attachment as downloaded."""
         storage = StorageManager(temp_output_dir)
@@ -76,6 +89,106 @@ class TestStorageManager:
             data = json.load(f)
             assert "att_001" in data["downloaded_attachments"]
 
+    def test_index_roundtrip_without_orjson(self, temp_output_dir, monkeypatch):
+        """Test that the stdlib-json fallback round-trips the index."""
+        monkeypatch.setattr("rev_exporter.storage.orjson", None)
+
+        storage = StorageManager(temp_output_dir)
+        storage.mark_downloaded("att_001")
+
+        reloaded = StorageManager(temp_output_dir)
+        assert reloaded.is_downloaded("att_001") is True
+
+    def test_mark_downloaded_batched(self, temp_output_dir):
+        """Test that batched mode coalesces index writes."""
+        storage = StorageManager(temp_output_dir, autoflush=False)
+        storage.mark_downloaded("att_001")
+
+        # The mark is only in memory until flushed
+        assert storage.is_downloaded("att_001") is True
+        assert not storage.index_file.exists()
+
+        storage.flush()
+        assert storage.index_file.exists()
+        with open(storage.index_file, "r") as f:
+            data = json.load(f)
+            assert "att_001" in data["downloaded_attachments"]
+
+        # Flushing again with nothing new is a no-op
+        storage.index_file.unlink()
+        storage.flush()
+        assert not storage.index_file.exists()
+
+    def test_batched_periodic_flush(self, temp_output_dir):
+        """Test that batched mode still flushes every FLUSH_EVERY marks."""
+        storage = StorageManager(temp_output_dir, autoflush=False)
+        storage.FLUSH_EVERY = 2
+
+        storage.mark_downloaded("att_001")
+        assert not storage.index_file.exists()
+
+        storage.mark_downloaded("att_002")
+        assert storage.index_file.exists()
+        assert not storage.log_file.exists()
+
+    def test_mark_downloaded_appends_log(self, temp_output_dir):
+        """Test that batched marks append to the log one id per line."""
+        storage = StorageManager(temp_output_dir, autoflush=False)
+        storage.mark_downloaded("att_001")
+        storage.mark_downloaded("att_002")
+
+        # O(1) appends land in the log, not the JSON snapshot
+        assert storage.log_file.read_text().splitlines() == ["att_001", "att_002"]
+        assert not storage.index_file.exists()
+
+        # A log left behind by an interrupted run is recovered on load
+        reloaded = StorageManager(temp_output_dir, autoflush=False)
+        assert reloaded.is_downloaded("att_001") is True
+        assert reloaded.is_downloaded("att_002") is True
+
+    def test_compact_folds_log_into_snapshot(self, temp_output_dir):
+        """Test that compact rewrites the snapshot and drops the log."""
+        storage = StorageManager(temp_output_dir, autoflush=False)
+        storage.mark_downloaded("att_001")
+        storage.mark_downloaded("att_002")
+
+        storage.compact()
+
+        assert not storage.log_file.exists()
+        with open(storage.index_file, "r") as f:
+            data = json.load(f)
+            assert set(data["downloaded_attachments"]) == {"att_001", "att_002"}
+
+    def test_load_index_log_io_error(self, temp_output_dir, monkeypatch):
+        """Test handling IO errors when loading the append log."""
+        log_file = temp_output_dir / ".rev-exporter-index.log"
+        log_file.write_text("att_001\n")
+
+        monkeypatch.setattr(
+            Path, "read_text", lambda self: (_ for _ in ()).throw(IOError("unreadable"))
+        )
+
+        # Should handle error gracefully
+        storage = StorageManager(temp_output_dir)
+        assert len(storage.downloaded_attachments) == 0
+
+    def test_append_log_io_error(self, temp_output_dir):
+        """Test handling IO errors when appending to the log."""
+        storage = StorageManager(temp_output_dir, autoflush=False)
+
+        with patch("builtins.open", side_effect=IOError("Permission denied")):
+            # Should not raise exception, just log error
+            storage.mark_downloaded("att_001")
+            assert "att_001" in storage.downloaded_attachments
+
+    def test_context_manager_flushes(self, temp_output_dir):
+        """Test that leaving the context manager flushes the index."""
+        with StorageManager(temp_output_dir, autoflush=False) as storage:
+            storage.mark_downloaded("att_001")
+            assert not storage.index_file.exists()
+
+        assert storage.index_file.exists()
+
     def test_get_order_dir(self, temp_output_dir):
         """Test getting order directory path."""
         storage = StorageManager(temp_output_dir)
@@ -97,6 +210,9 @@ class TestStorageManager:
         assert dirs["transcripts"] == temp_output_dir / "12345" / "transcripts"
         assert dirs["other"] == temp_output_dir / "12345" / "other"
 
+        # Repeat calls for the same order hit the cache
+        assert storage.create_order_structure("12345") is dirs
+
     def test_save_attachment_media(self, temp_output_dir):
         """Test saving media attachment."""
         storage = StorageManager(temp_output_dir)
@@ -151,6 +267,36 @@ class TestStorageManager:
         assert file_path.exists()
         assert file_path.parent == temp_output_dir / "12345" / "other"
 
+    def test_save_attachment_stream(self, temp_output_dir):
+        """Test streaming an attachment from a file-like source."""
+        import io
+
+        storage = StorageManager(temp_output_dir)
+        attachment = Attachment(id="att_006", name="audio.mp3", type="media")
+
+        file_path = storage.save_attachment_stream(
+            "12345", attachment, AttachmentType.MEDIA, io.BytesIO(b"audio content"), ".mp3"
+        )
+
+        assert file_path.exists()
+        assert file_path.parent == temp_output_dir / "12345" / "media"
+        assert file_path.read_bytes() == b"audio content"
+        assert "att_006" in file_path.name
+
+    def test_save_attachment_async(self, temp_output_dir):
+        """Test that async_writes returns futures and flush waits for them."""
+        with StorageManager(temp_output_dir, async_writes=True) as storage:
+            attachment = Attachment(id="att_005", name="audio.mp3", type="media")
+            future = storage.save_attachment(
+                "12345", attachment, AttachmentType.MEDIA, b"audio content", ".mp3"
+            )
+            storage.flush()
+            file_path = future.result()
+
+        assert file_path.exists()
+        assert file_path.parent == temp_output_dir / "12345" / "media"
+        assert file_path.read_bytes() == b"audio content"
+
     def test_save_order_metadata(self, temp_output_dir, sample_order_data):
         """Test saving order metadata."""
         storage = StorageManager(temp_output_dir)